@@ -1,12 +1,14 @@
 """
 Script para criar um ícone simples para a aplicação.
 """
-from PyQt5.QtGui import QPixmap, QPainter, QColor, QFont
-from PyQt5.QtCore import Qt
-import sys
+
 
 def create_icon():
     """Cria um ícone simples com a letra 'D' para Determinante."""
+    # Importado aqui para não carregar o Qt ao apenas importar o módulo
+    from PyQt5.QtGui import QPixmap, QPainter, QColor, QFont
+    from PyQt5.QtCore import Qt
+    
     # Criar pixmap de 64x64
     pixmap = QPixmap(64, 64)
     pixmap.fill(QColor(0, 120, 212))  # Azul elétrico
@@ -32,4 +34,8 @@ def create_icon():
     print("Ícone criado: icon.ico")
 
 if __name__ == "__main__":
+    from PyQt5.QtWidgets import QApplication
+    
+    # QPixmap precisa de uma QGuiApplication ativa
+    app = QApplication.instance() or QApplication([])
     create_icon()
@@ -0,0 +1,133 @@
+"""
+Gaussian elimination kernels used when SciPy is not available.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    numba_installed = True
+except ImportError:
+    numba_installed = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def _gauss_det_kernel(a: np.ndarray) -> float:
+    """
+    Calculate determinant by Gaussian elimination with partial pivoting.
+
+    Args:
+        a: Square float64 array, overwritten with its upper triangular form
+
+    Returns:
+        Determinant value (0.0 if the matrix is singular)
+    """
+    n = a.shape[0]
+    row_swaps = 0
+
+    for i in range(n):
+        # Find the pivot (largest element in current column)
+        max_row = i
+        max_val = abs(a[i, i])
+        for k in range(i + 1, n):
+            v = abs(a[k, i])
+            if v > max_val:
+                max_val = v
+                max_row = k
+
+        # Swap rows if necessary
+        if max_row != i:
+            for j in range(i, n):
+                tmp = a[i, j]
+                a[i, j] = a[max_row, j]
+                a[max_row, j] = tmp
+            row_swaps += 1
+
+        # If pivot is zero, matrix is singular
+        if max_val < 1e-10:
+            return 0.0
+
+        # Eliminate column below pivot
+        inv_pivot = 1.0 / a[i, i]
+        for k in range(i + 1, n):
+            value = a[k, i]
+            if abs(value) > 1e-10:  # Skip if already zero
+                factor = value * inv_pivot
+                for j in range(i, n):
+                    a[k, j] -= factor * a[i, j]
+
+    # Calculate determinant as product of diagonal elements
+    determinant = 1.0
+    for i in range(n):
+        determinant *= a[i, i]
+
+    # Apply sign change for row swaps
+    if row_swaps % 2 == 1:
+        determinant = -determinant
+
+    return determinant
+
+
+def _gauss_det_numpy(a: np.ndarray, block_size: int = 64) -> float:
+    """
+    Calculate determinant by blocked Gaussian elimination using NumPy.
+
+    Used instead of the kernel above when Numba is not installed. Columns are
+    factored in panels of ``block_size`` with rank-1 updates restricted to the
+    panel; the rows to the right of the panel are then solved against the
+    panel's unit lower triangle and the trailing submatrix receives a single
+    matrix-product update per panel (right-looking blocked LU, as in LAPACK
+    dgetrf), so it is swept once per panel rather than once per pivot.
+
+    Args:
+        a: Square float64 array, overwritten with its LU factors
+        block_size: Number of columns factored per panel
+
+    Returns:
+        Determinant value (0.0 if the matrix is singular)
+    """
+    n = a.shape[0]
+    row_swaps = 0
+
+    for i0 in range(0, n, block_size):
+        i1 = min(i0 + block_size, n)
+
+        # Factor the panel a[i0:, i0:i1]
+        for i in range(i0, i1):
+            # Find the pivot (largest element in current column)
+            max_row = i + int(np.argmax(np.abs(a[i:, i])))
+
+            # Swap whole rows so the pending trailing update sees the swap
+            if max_row != i:
+                a[[i, max_row]] = a[[max_row, i]]
+                row_swaps += 1
+
+            # If pivot is zero, matrix is singular
+            if abs(a[i, i]) < 1e-10:
+                return 0.0
+
+            # Store multipliers below the pivot and eliminate within the panel
+            a[i + 1:, i] *= 1.0 / a[i, i]
+            a[i + 1:, i + 1:i1] -= a[i + 1:, i:i + 1] * a[i, i + 1:i1]
+
+        if i1 < n:
+            # Rows of U right of the panel: forward substitution with unit L11
+            for r in range(i0 + 1, i1):
+                a[r, i1:] -= a[r, i0:r] @ a[i0:r, i1:]
+
+            # Trailing submatrix: one rank-(block_size) update
+            a[i1:, i1:] -= a[i1:, i0:i1] @ a[i0:i1, i1:]
+
+    # Calculate determinant as product of diagonal elements
+    determinant = float(np.prod(np.diag(a)))
+
+    # Apply sign change for row swaps
+    if row_swaps % 2 == 1:
+        determinant = -determinant
+
+    return determinant
@@ -2,8 +2,18 @@
 Determinant calculator using Gaussian elimination (row reduction).
 """
 import logging
-from typing import List, Tuple
+import math
+import warnings
+from typing import Iterator, List, Tuple, Union
+import numpy as np
 from .matrix import Matrix
+from ._det_kernel import _gauss_det_kernel, _gauss_det_numpy, numba_installed
+
+try:
+    from scipy.linalg import LinAlgWarning, lu_factor
+    scipy_installed = True
+except ImportError:
+    scipy_installed = False
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +24,17 @@ class DeterminantCalculator:
     @staticmethod
     def calculate(matrix: Matrix) -> float:
         """
-        Calculate determinant using Gaussian elimination.
+        Calculate determinant using LAPACK LU factorization with partial pivoting.
+        
+        Falls back to Gaussian elimination (a Numba-compiled kernel, or
+        vectorized NumPy row operations) if SciPy is not installed. Orders up
+        to 4 use closed-form formulas unless an intermediate product overflows.
+        
+        Singularity is decided differently by path: factored matrices are
+        singular when a pivot is below 1e-10 in absolute value, while
+        closed-form results use the relative test in _is_round_off. A 4x4
+        matrix with a tiny but well-separated pivot therefore keeps its small
+        determinant, where the same matrix at order 5 would give 0.0.
         
         Args:
             matrix: Square matrix to calculate determinant for
@@ -28,53 +48,145 @@ class DeterminantCalculator:
         if not matrix.is_square:
             raise ValueError("Matrix must be square to calculate determinant")
         
-        logger.info(f"Calculating determinant for {matrix.rows}x{matrix.cols} matrix using Gaussian elimination")
-        
-        # Create a copy of the matrix to avoid modifying the original
-        matrix_data = matrix.to_list()
-        n = matrix.rows
-        determinant = 1.0
-        row_swaps = 0
+        # Orders up to 4 use straight-line closed-form formulas
+        if matrix.rows <= 4:
+            logger.info("Calculating determinant for %dx%d matrix using closed-form formula", matrix.rows, matrix.cols)
+            a = matrix.to_list()
+            determinant = DeterminantCalculator._closed_form(a)
+            if math.isfinite(determinant):
+                if DeterminantCalculator._is_round_off(a, determinant):
+                    logger.info("Matrix is singular (determinant = 0)")
+                    return 0.0
+                logger.info("Final determinant: %s", determinant)
+                return determinant
+            # An intermediate product overflowed; factor the matrix instead
+            logger.info("Closed-form formula overflowed, falling back to elimination")
         
-        # Convert to upper triangular form
-        for i in range(n):
-            # Find the pivot (largest element in current column)
-            max_row = i
-            for k in range(i + 1, n):
-                if abs(matrix_data[k][i]) > abs(matrix_data[max_row][i]):
-                    max_row = k
-            
-            # Swap rows if necessary
-            if max_row != i:
-                matrix_data[i], matrix_data[max_row] = matrix_data[max_row], matrix_data[i]
-                row_swaps += 1
-                logger.debug(f"Swapped rows {i} and {max_row}")
-            
-            # If pivot is zero, matrix is singular
-            if abs(matrix_data[i][i]) < 1e-10:
+        # Triangular (or diagonal) input needs no elimination
+        a = matrix.to_array(copy=False)
+        if not np.tril(a, -1).any() or not np.triu(a, 1).any():
+            logger.info("Calculating determinant for %dx%d triangular matrix from its diagonal", matrix.rows, matrix.cols)
+            diagonal = np.diag(a)
+            if np.any(np.abs(diagonal) < 1e-10):
                 logger.info("Matrix is singular (determinant = 0)")
                 return 0.0
-            
-            # Eliminate column below pivot
-            for k in range(i + 1, n):
-                if abs(matrix_data[k][i]) > 1e-10:  # Skip if already zero
-                    factor = matrix_data[k][i] / matrix_data[i][i]
-                    logger.debug(f"Eliminating element ({k},{i}) using factor {factor}")
-                    
-                    for j in range(i, n):
-                        matrix_data[k][j] -= factor * matrix_data[i][j]
+            determinant = float(np.prod(diagonal))
+            logger.info("Final determinant: %s", determinant)
+            return determinant
         
-        # Calculate determinant as product of diagonal elements
-        for i in range(n):
-            determinant *= matrix_data[i][i]
+        if not scipy_installed:
+            method = "compiled" if numba_installed else "NumPy"
+            logger.info("Calculating determinant for %dx%d matrix using %s Gaussian elimination", matrix.rows, matrix.cols, method)
+            kernel = _gauss_det_kernel if numba_installed else _gauss_det_numpy
+            determinant = float(kernel(matrix.to_array()))
+            logger.info("Final determinant: %s", determinant)
+            return determinant
         
-        # Apply sign change for row swaps
+        logger.info("Calculating determinant for %dx%d matrix using LU factorization", matrix.rows, matrix.cols)
+        
+        diagonal, row_swaps = DeterminantCalculator._lu_diagonal(matrix)
+        
+        # If any pivot is zero, matrix is singular
+        if np.any(np.abs(diagonal) < 1e-10):
+            logger.info("Matrix is singular (determinant = 0)")
+            return 0.0
+        
+        determinant = float(np.prod(diagonal))
         if row_swaps % 2 == 1:
             determinant = -determinant
         
-        logger.info(f"Final determinant: {determinant} (after {row_swaps} row swaps)")
+        logger.info("Final determinant: %s (after %d row swaps)", determinant, row_swaps)
         return determinant
     
+    @staticmethod
+    def calculate_batch(matrices: List[Matrix]) -> np.ndarray:
+        """
+        Calculate determinants of many same-sized matrices in one call.
+        
+        The matrices are stacked into a (count, n, n) array and factored by
+        a single batched LAPACK call, so per-matrix Python overhead is paid
+        once. Unlike calculate, no 1e-10 singularity threshold is applied.
+        
+        Args:
+            matrices: Square matrices, all of the same order
+            
+        Returns:
+            Array of determinant values, one per matrix
+            
+        Raises:
+            ValueError: If a matrix is not square or orders differ
+        """
+        if not matrices:
+            return np.empty(0)
+        
+        n = matrices[0].rows
+        if not all(m.is_square and m.rows == n for m in matrices):
+            raise ValueError("All matrices must be square and of the same order")
+        
+        logger.info("Calculating determinants for batch of %d %dx%d matrices", len(matrices), n, n)
+        
+        stack = np.stack([m.to_array(copy=False) for m in matrices])
+        sign, log_det = np.linalg.slogdet(stack)
+        return sign * np.exp(log_det)
+    
+    @staticmethod
+    def calculate_log(matrix: Matrix) -> Tuple[float, float]:
+        """
+        Calculate sign and natural log of the absolute determinant.
+        
+        The diagonal of U is reduced by summing logarithms instead of
+        multiplying, so large or ill-conditioned matrices whose determinant
+        overflows or underflows a float still give a usable result.
+        
+        Args:
+            matrix: Square matrix to calculate determinant for
+            
+        Returns:
+            Tuple of (sign, log_abs_determinant); (0.0, -inf) if singular
+            
+        Raises:
+            ValueError: If matrix is not square
+        """
+        if not matrix.is_square:
+            raise ValueError("Matrix must be square to calculate determinant")
+        
+        if not scipy_installed:
+            sign, log_det = np.linalg.slogdet(matrix.to_array(copy=False))
+            return float(sign), float(log_det)
+        
+        diagonal, row_swaps = DeterminantCalculator._lu_diagonal(matrix)
+        
+        # If any pivot is zero, matrix is singular
+        if np.any(np.abs(diagonal) < 1e-10):
+            return 0.0, float('-inf')
+        
+        sign = float(np.prod(np.sign(diagonal)))
+        if row_swaps % 2 == 1:
+            sign = -sign
+        log_det = float(np.sum(np.log(np.abs(diagonal))))
+        
+        logger.info("Final log determinant: sign %s, log|det| %s", sign, log_det)
+        return sign, log_det
+    
+    @staticmethod
+    def _lu_diagonal(matrix: Matrix) -> Tuple[np.ndarray, int]:
+        """
+        LU-factor the matrix with LAPACK and return the diagonal of U.
+        
+        Returns:
+            Tuple of (diagonal of U, number of row swaps)
+        """
+        # LAPACK (dgetrf) works on a fresh float64 copy, so it may overwrite it
+        a = matrix.to_array()
+        with warnings.catch_warnings():
+            # Exactly singular input is reported by the caller, not as a LinAlgWarning
+            warnings.simplefilter("ignore", LinAlgWarning)
+            lu, piv = lu_factor(a, overwrite_a=True, check_finite=False)
+        
+        # Each entry of piv that differs from its index is one row swap
+        row_swaps = int(np.count_nonzero(piv != np.arange(len(piv))))
+        return np.diag(lu), row_swaps
+    
     @staticmethod
     def calculate_with_steps(matrix: Matrix) -> Tuple[float, List[str]]:
         """
@@ -87,93 +199,203 @@ class DeterminantCalculator:
             Tuple of (determinant, list of step descriptions)
         """
         steps = []
+        for kind, value in DeterminantCalculator.iter_calculate_with_steps(matrix):
+            if kind == "done":
+                return value, steps
+            steps.append(value)
+    
+    @staticmethod
+    def iter_calculate_with_steps(matrix: Matrix) -> Iterator[Tuple[str, Union[str, float]]]:
+        """
+        Calculate determinant, yielding step descriptions as they are produced.
         
+        Args:
+            matrix: Square matrix to calculate determinant for
+            
+        Yields:
+            ("step", description) for each step, then ("done", determinant)
+            
+        Raises:
+            ValueError: If matrix is not square
+        """
         if not matrix.is_square:
             raise ValueError("Matrix must be square to calculate determinant")
         
-        steps.append(f"Calculating determinant for {matrix.rows}x{matrix.cols} matrix using Gaussian elimination")
-        steps.append("=" * 50)
+        closed_form = None
+        if matrix.rows <= 4:
+            a = matrix.to_list()
+            closed_form = DeterminantCalculator._closed_form(a)
+        
+        # Fall through to elimination if an intermediate product overflowed
+        if closed_form is not None and math.isfinite(closed_form):
+            yield "step", f"Calculating determinant for {matrix.rows}x{matrix.cols} matrix using closed-form cofactor expansion"
+            yield "step", "=" * 50
+            yield "step", "Matrix:"
+            yield "step", DeterminantCalculator._format_matrix(a)
+            for line in DeterminantCalculator._closed_form_steps(a):
+                yield "step", line
+            if DeterminantCalculator._is_round_off(a, closed_form):
+                yield "step", f"\nResult {closed_form} is round-off error - matrix is singular!"
+                yield "step", "Determinant = 0"
+                yield "done", 0.0
+                return
+            yield "step", f"\nFinal determinant: {closed_form}"
+            yield "done", closed_form
+            return
+        
+        yield "step", f"Calculating determinant for {matrix.rows}x{matrix.cols} matrix using Gaussian elimination"
+        yield "step", "=" * 50
         
         # Create a copy of the matrix to avoid modifying the original
-        matrix_data = [row[:] for row in matrix.to_list()]
+        matrix_data = matrix.to_array()
         n = matrix.rows
         determinant = 1.0
         row_swaps = 0
         
-        steps.append("Initial matrix:")
-        DeterminantCalculator._add_matrix_to_steps(steps, matrix_data)
+        yield "step", "Initial matrix:"
+        yield "step", DeterminantCalculator._format_matrix(matrix_data)
         
         # Convert to upper triangular form
         for i in range(n):
-            steps.append(f"\n--- Step {i+1}: Working with column {i+1} ---")
+            yield "step", f"\n--- Step {i+1}: Working with column {i+1} ---"
             
             # Find the pivot (largest element in current column)
-            max_row = i
-            for k in range(i + 1, n):
-                if abs(matrix_data[k][i]) > abs(matrix_data[max_row][i]):
-                    max_row = k
+            max_row = i + int(np.argmax(np.abs(matrix_data[i:, i])))
             
             # Swap rows if necessary
             if max_row != i:
-                matrix_data[i], matrix_data[max_row] = matrix_data[max_row], matrix_data[i]
+                matrix_data[[i, max_row]] = matrix_data[[max_row, i]]
                 row_swaps += 1
-                steps.append(f"Swapped rows {i+1} and {max_row+1} (row swap #{row_swaps})")
-                DeterminantCalculator._add_matrix_to_steps(steps, matrix_data)
+                yield "step", f"Swapped rows {i+1} and {max_row+1} (row swap #{row_swaps})"
+                yield "step", DeterminantCalculator._format_matrix(matrix_data)
             
             # If pivot is zero, matrix is singular
             if abs(matrix_data[i][i]) < 1e-10:
-                steps.append("Pivot is zero - matrix is singular!")
-                steps.append("Determinant = 0")
-                return 0.0, steps
+                yield "step", "Pivot is zero - matrix is singular!"
+                yield "step", "Determinant = 0"
+                yield "done", 0.0
+                return
             
-            steps.append(f"Pivot element: {matrix_data[i][i]}")
+            row_i = matrix_data[i]
+            pivot = row_i[i]
+            inv_pivot = 1.0 / pivot
+            yield "step", f"Pivot element: {pivot}"
             
             # Eliminate column below pivot
             for k in range(i + 1, n):
-                if abs(matrix_data[k][i]) > 1e-10:  # Skip if already zero
-                    factor = matrix_data[k][i] / matrix_data[i][i]
-                    steps.append(f"Eliminating row {k+1}: factor = {matrix_data[k][i]} / {matrix_data[i][i]} = {factor:.4f}")
+                row_k = matrix_data[k]
+                value = row_k[i]
+                if abs(value) > 1e-10:  # Skip if already zero
+                    factor = value * inv_pivot
+                    yield "step", f"Eliminating row {k+1}: factor = {value} / {pivot} = {factor:.4f}"
+                    yield "step", f"  Row {k+1} = Row {k+1} - {factor:.4f} * Row {i+1}"
+                    row_k[i:] -= factor * row_i[i:]
                     
-                    for j in range(i, n):
-                        old_value = matrix_data[k][j]
-                        matrix_data[k][j] -= factor * matrix_data[i][j]
-                        if j == i:  # Only log the first element to avoid clutter
-                            steps.append(f"  Row {k+1} = Row {k+1} - {factor:.4f} * Row {i+1}")
-                    
-                    DeterminantCalculator._add_matrix_to_steps(steps, matrix_data)
+                    yield "step", DeterminantCalculator._format_matrix(matrix_data)
         
-        steps.append("\n--- Final triangular matrix ---")
-        DeterminantCalculator._add_matrix_to_steps(steps, matrix_data)
+        yield "step", "\n--- Final triangular matrix ---"
+        yield "step", DeterminantCalculator._format_matrix(matrix_data)
         
         # Calculate determinant as product of diagonal elements
-        steps.append("\nCalculating determinant:")
+        yield "step", "\nCalculating determinant:"
         diagonal_products = []
         for i in range(n):
-            diagonal_products.append(matrix_data[i][i])
-            steps.append(f"Diagonal element [{i+1},{i+1}] = {matrix_data[i][i]}")
+            diagonal_products.append(float(matrix_data[i][i]))
+            yield "step", f"Diagonal element [{i+1},{i+1}] = {matrix_data[i][i]}"
         
         determinant = 1.0
         for i, val in enumerate(diagonal_products):
             determinant *= val
             if i == 0:
-                steps.append(f"Product so far: {val}")
+                yield "step", f"Product so far: {val}"
             else:
-                steps.append(f"Product so far: {determinant} * {val} = {determinant}")
+                yield "step", f"Product so far: {determinant} * {val} = {determinant}"
         
         # Apply sign change for row swaps
         if row_swaps % 2 == 1:
             determinant = -determinant
-            steps.append(f"\nApplied sign change for {row_swaps} row swaps (odd number)")
-            steps.append(f"Final determinant: -{abs(determinant)} = {determinant}")
+            yield "step", f"\nApplied sign change for {row_swaps} row swaps (odd number)"
+            yield "step", f"Final determinant: -{abs(determinant)} = {determinant}"
         else:
-            steps.append(f"\nNo sign change needed ({row_swaps} row swaps - even number)")
-            steps.append(f"Final determinant: {determinant}")
+            yield "step", f"\nNo sign change needed ({row_swaps} row swaps - even number)"
+            yield "step", f"Final determinant: {determinant}"
+        
+        yield "done", determinant
+    
+    @staticmethod
+    def _closed_form(a: List[List[float]]) -> float:
+        """Determinant of a matrix of order 1 to 4 by explicit formula."""
+        n = len(a)
+        if n == 1:
+            return a[0][0]
+        if n == 2:
+            return a[0][0] * a[1][1] - a[0][1] * a[1][0]
+        if n == 3:
+            return (a[0][0] * (a[1][1] * a[2][2] - a[1][2] * a[2][1])
+                    - a[0][1] * (a[1][0] * a[2][2] - a[1][2] * a[2][0])
+                    + a[0][2] * (a[1][0] * a[2][1] - a[1][1] * a[2][0]))
+        
+        # Order 4: Laplace expansion over the 2x2 minors of the first two rows
+        s0 = a[0][0] * a[1][1] - a[1][0] * a[0][1]
+        s1 = a[0][0] * a[1][2] - a[1][0] * a[0][2]
+        s2 = a[0][0] * a[1][3] - a[1][0] * a[0][3]
+        s3 = a[0][1] * a[1][2] - a[1][1] * a[0][2]
+        s4 = a[0][1] * a[1][3] - a[1][1] * a[0][3]
+        s5 = a[0][2] * a[1][3] - a[1][2] * a[0][3]
+        c5 = a[2][2] * a[3][3] - a[3][2] * a[2][3]
+        c4 = a[2][1] * a[3][3] - a[3][1] * a[2][3]
+        c3 = a[2][1] * a[3][2] - a[3][1] * a[2][2]
+        c2 = a[2][0] * a[3][3] - a[3][0] * a[2][3]
+        c1 = a[2][0] * a[3][2] - a[3][0] * a[2][2]
+        c0 = a[2][0] * a[3][1] - a[3][0] * a[2][1]
+        return s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+    
+    @staticmethod
+    def _is_round_off(a: List[List[float]], determinant: float) -> bool:
+        """
+        Check whether a closed-form determinant is indistinguishable from zero.
         
-        return determinant, steps
+        The closed-form formulas have no pivots, so instead of the absolute
+        1e-10 pivot test used by elimination (orders 5 and up), the result is
+        compared with 1e-10 times Hadamard's bound on |det| (the product of
+        the row norms). The test is relative: it zeroes round-off noise but
+        not a matrix that is merely small, such as diag(1e-11, 1, 1, 1).
+        """
+        bound = 1.0
+        for row in a:
+            bound *= math.sqrt(sum(x * x for x in row))
+        # An overflowed result or bound says nothing about singularity
+        if not (math.isfinite(determinant) and math.isfinite(bound)):
+            return False
+        return abs(determinant) <= 1e-10 * bound
+    
+    @staticmethod
+    def _closed_form_steps(a: List[List[float]]) -> Iterator[str]:
+        """Describe the closed-form expression used by _closed_form."""
+        n = len(a)
+        if n == 1:
+            yield f"det = {a[0][0]}"
+        elif n == 2:
+            yield f"det = {a[0][0]} * {a[1][1]} - {a[0][1]} * {a[1][0]}"
+        elif n == 3:
+            yield "Cofactor expansion along row 1:"
+            for j in range(3):
+                sign = "+" if j % 2 == 0 else "-"
+                cols = [c for c in range(3) if c != j]
+                minor = a[1][cols[0]] * a[2][cols[1]] - a[1][cols[1]] * a[2][cols[0]]
+                yield (f"  {sign} {a[0][j]} * ({a[1][cols[0]]} * {a[2][cols[1]]} - "
+                       f"{a[1][cols[1]]} * {a[2][cols[0]]}) = {sign} {a[0][j]} * {minor}")
+        else:
+            yield "Laplace expansion along rows 1 and 2 (2x2 minors times complementary minors):"
+            pairs = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+            for j1, j2 in pairs:
+                k1, k2 = [c for c in range(4) if c not in (j1, j2)]
+                sign = "+" if (j1 + j2 + 1) % 2 == 0 else "-"
+                top = a[0][j1] * a[1][j2] - a[0][j2] * a[1][j1]
+                bottom = a[2][k1] * a[3][k2] - a[2][k2] * a[3][k1]
+                yield f"  {sign} minor(cols {j1+1},{j2+1}) * complement(cols {k1+1},{k2+1}) = {sign} {top} * {bottom}"
     
     @staticmethod
-    def _add_matrix_to_steps(steps: List[str], matrix_data: List[List[float]]) -> None:
-        """Add matrix representation to steps list."""
-        for i, row in enumerate(matrix_data):
-            row_str = "  " + "  ".join(f"{elem:8.3f}" for elem in row)
-            steps.append(row_str)
+    def _format_matrix(matrix_data: Union[np.ndarray, List[List[float]]]) -> str:
+        """Render matrix as one step string, one line per row."""
+        return "\n".join("  " + "  ".join(f"{elem:8.3f}" for elem in row) for row in matrix_data)
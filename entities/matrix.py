@@ -1,8 +1,9 @@
 """
 Matrix entity representing a mathematical matrix.
 """
-from typing import List, Optional
+from typing import List, Optional, Union
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -10,33 +11,75 @@ logger = logging.getLogger(__name__)
 class Matrix:
     """Represents a mathematical matrix with operations for determinant calculation."""
     
-    def __init__(self, data: List[List[float]]):
+    def __init__(self, data: Union[List[List[float]], np.ndarray], copy: bool = True):
         """
         Initialize matrix with given data.
         
         Args:
-            data: 2D list representing matrix elements
+            data: 2D list or 2D ndarray representing matrix elements
+            copy: If False, a float64 C-contiguous ndarray is used as-is
+                instead of being copied; only pass False for freshly built
+                data that the caller will not modify afterwards
         """
-        self._validate_matrix(data)
-        self._data = [row[:] for row in data]  # Deep copy
-        self._rows = len(data)
-        self._cols = len(data[0]) if data else 0
+        arr = self.validate_data(data)
+        # Contiguous row-major float64 storage, handed to NumPy/LAPACK without conversion.
+        # An array built from nested lists is already private; data itself or a
+        # view of it (np.matrix, DataFrame.values) would alias the caller's buffer.
+        if copy and (arr is data or arr.base is not None):
+            self._data = np.array(arr, dtype=np.float64, order='C')
+        else:
+            self._data = np.ascontiguousarray(arr, dtype=np.float64)
+        self._rows, self._cols = self._data.shape
+        self._is_square = self._rows == self._cols
         
-        logger.info(f"Matrix created with dimensions {self._rows}x{self._cols}")
+        logger.info("Matrix created with dimensions %dx%d", self._rows, self._cols)
     
-    def _validate_matrix(self, data: List[List[float]]) -> None:
-        """Validate that the matrix data is properly formatted."""
-        if not data:
-            raise ValueError("Matrix cannot be empty")
+    @classmethod
+    def _from_ndarray(cls, data: np.ndarray) -> 'Matrix':
+        """
+        Wrap an already valid array without validating or copying it.
         
-        if not all(isinstance(row, list) for row in data):
-            raise ValueError("All rows must be lists")
+        Args:
+            data: Non-empty 2D float64 C-contiguous ndarray owned by the new matrix
+            
+        Returns:
+            New Matrix instance backed by data
+        """
+        matrix = cls.__new__(cls)
+        matrix._data = data
+        matrix._rows, matrix._cols = data.shape
+        matrix._is_square = matrix._rows == matrix._cols
         
-        if not all(len(row) == len(data[0]) for row in data):
+        logger.info("Matrix created with dimensions %dx%d", matrix._rows, matrix._cols)
+        return matrix
+    
+    @staticmethod
+    def validate_data(data: Union[List[List[float]], np.ndarray]) -> np.ndarray:
+        """
+        Validate that the matrix data is properly formatted.
+        
+        Returns:
+            data as an ndarray (data itself if it already was one)
+            
+        Raises:
+            ValueError: If data is ragged, empty, not 2D or not numeric
+        """
+        try:
+            arr = np.asarray(data)
+        except ValueError:
+            # NumPy >= 1.24 raises for ragged rows instead of building an object array
             raise ValueError("All rows must have the same length")
         
-        if not all(isinstance(element, (int, float)) for row in data for element in row):
+        if arr.size == 0:
+            raise ValueError("Matrix cannot be empty")
+        
+        if arr.ndim != 2:
+            raise ValueError("Matrix must be two-dimensional")
+        
+        if arr.dtype.kind not in 'biuf':
             raise ValueError("All elements must be numbers")
+        
+        return arr
     
     @property
     def rows(self) -> int:
@@ -51,20 +94,20 @@ class Matrix:
     @property
     def is_square(self) -> bool:
         """Check if matrix is square."""
-        return self._rows == self._cols
+        return self._is_square
     
     def get_element(self, row: int, col: int) -> float:
         """Get element at specified position."""
         if not (0 <= row < self._rows and 0 <= col < self._cols):
             raise IndexError("Index out of bounds")
-        return self._data[row][col]
+        return float(self._data[row, col])
     
     def set_element(self, row: int, col: int, value: float) -> None:
         """Set element at specified position."""
         if not (0 <= row < self._rows and 0 <= col < self._cols):
             raise IndexError("Index out of bounds")
-        self._data[row][col] = value
-        logger.debug(f"Set element at ({row}, {col}) to {value}")
+        self._data[row, col] = value
+        logger.debug("Set element at (%d, %d) to %s", row, col, value)
     
     def get_submatrix(self, exclude_row: int, exclude_col: int) -> 'Matrix':
         """
@@ -80,21 +123,28 @@ class Matrix:
         if not (0 <= exclude_row < self._rows and 0 <= exclude_col < self._cols):
             raise IndexError("Exclude indices out of bounds")
         
-        submatrix_data = []
-        for i in range(self._rows):
-            if i != exclude_row:
-                row = []
-                for j in range(self._cols):
-                    if j != exclude_col:
-                        row.append(self._data[i][j])
-                submatrix_data.append(row)
+        rows_idx = np.arange(self._rows) != exclude_row
+        cols_idx = np.arange(self._cols) != exclude_col
+        submatrix_data = self._data[np.ix_(rows_idx, cols_idx)]
+        if submatrix_data.size == 0:
+            raise ValueError("Matrix cannot be empty")
         
-        logger.debug(f"Created submatrix excluding row {exclude_row} and col {exclude_col}")
-        return Matrix(submatrix_data)
+        logger.debug("Created submatrix excluding row %d and col %d", exclude_row, exclude_col)
+        return Matrix._from_ndarray(submatrix_data)
     
     def to_list(self) -> List[List[float]]:
         """Convert matrix to 2D list."""
-        return [row[:] for row in self._data]
+        return self._data.tolist()
+    
+    def to_array(self, copy: bool = True) -> np.ndarray:
+        """
+        Get the matrix as a contiguous float64 ndarray.
+        
+        Args:
+            copy: If False, return the internal array itself; the caller
+                must treat it as read-only
+        """
+        return self._data.copy() if copy else self._data
     
     def __str__(self) -> str:
         """String representation of matrix."""
@@ -102,4 +152,4 @@ class Matrix:
     
     def __repr__(self) -> str:
         """Detailed string representation."""
-        return f"Matrix({self._data})"
+        return f"Matrix({self._data.tolist()})"
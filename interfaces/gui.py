@@ -4,20 +4,157 @@ GUI interface using PyQt5 for matrix determinant calculator with modern dark the
 import sys
 import logging
 from typing import List, Optional
+import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QGridLayout, QLabel, QLineEdit, 
-                            QComboBox, QPushButton, QMessageBox, QFrame,
-                            QSizePolicy, QSpacerItem, QScrollArea, QSpinBox)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-from PyQt5.QtGui import QFont, QPalette, QColor, QLinearGradient, QBrush, QWheelEvent, QTransform
+                            QPushButton, QMessageBox, QScrollArea, QSpinBox,
+                            QCheckBox, QTableView, QStyledItemDelegate)
+from PyQt5.QtCore import (Qt, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool,
+                          QAbstractTableModel, QModelIndex, QLocale, QEvent)
+from PyQt5.QtGui import QPalette, QColor, QWheelEvent, QDoubleValidator
 from use_cases.calculate_determinant_use_case import CalculateDeterminantUseCase
 
 logger = logging.getLogger(__name__)
 
+# From this order up the matrix is edited in a QTableView instead of a QLineEdit grid
+LARGE_MATRIX_THRESHOLD = 20
+
+
+class MatrixModel(QAbstractTableModel):
+    """Table model exposing a float64 ndarray as editable matrix cells."""
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        """Initialize the model with an empty matrix."""
+        super().__init__(parent)
+        self.arr = np.zeros((0, 0))
+    
+    def reset(self, size: int):
+        """Replace the matrix with a size x size matrix of zeros."""
+        self.beginResetModel()
+        self.arr = np.zeros((size, size))
+        self.endResetModel()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of matrix rows."""
+        return 0 if parent.isValid() else self.arr.shape[0]
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of matrix columns."""
+        return 0 if parent.isValid() else self.arr.shape[1]
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """Return the cell value as text for display and editing."""
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return f"{self.arr[index.row(), index.column()]:g}"
+        if role == Qt.EditRole:
+            # Full precision, positional so the editor's validator accepts it
+            return np.format_float_positional(self.arr[index.row(), index.column()], trim='-')
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+    
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        """Store an edited cell value; non-numeric text is rejected."""
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        try:
+            self.arr[index.row(), index.column()] = float(value)
+        except ValueError:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+    
+    def flags(self, index: QModelIndex):
+        """Every cell is editable."""
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+
+class NumericDelegate(QStyledItemDelegate):
+    """Item delegate whose editor only accepts numbers."""
+    
+    def __init__(self, validator: QDoubleValidator, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._validator = validator
+    
+    def createEditor(self, parent, option, index):
+        """Create a centered line edit with the shared double validator."""
+        editor = QLineEdit(parent)
+        editor.setAlignment(Qt.AlignCenter)
+        editor.setValidator(self._validator)
+        return editor
+
+
+class DeterminantSignals(QObject):
+    """Signals used by DeterminantTask to report back to the GUI thread."""
+    
+    finished = pyqtSignal(float)
+    error = pyqtSignal(str)
+
+
+class DeterminantTask(QRunnable):
+    """Runs a determinant calculation on the global thread pool."""
+    
+    def __init__(self, use_case: CalculateDeterminantUseCase, matrix_data: np.ndarray, show_steps: bool):
+        """
+        Initialize the task.
+        
+        Args:
+            use_case: Use case that performs the calculation
+            matrix_data: 2D ndarray representing matrix elements
+            show_steps: Whether to trace and log the calculation steps
+        """
+        super().__init__()
+        self.use_case = use_case
+        self.matrix_data = matrix_data
+        self.show_steps = show_steps
+        self.signals = DeterminantSignals()
+    
+    def run(self):
+        """Calculate the determinant and emit the result or the error."""
+        try:
+            if self.show_steps:
+                determinant, steps = self.use_case.execute(self.matrix_data)
+                for step in steps:
+                    logger.info(step)
+            else:
+                determinant = self.use_case.execute_fast(self.matrix_data)
+            self.signals.finished.emit(float(determinant))
+            
+        except ValueError as e:
+            self.signals.error.emit(str(e))
+            
+        except Exception as e:
+            self.signals.error.emit(f"Erro inesperado: {str(e)}")
+
 
 class MatrixDeterminantGUI(QMainWindow):
     """GUI for matrix determinant calculator with modern dark theme using PyQt5."""
     
+    # Single source of truth for matrix entry styling, set on the container.
+    # Colours are filled in once; zoom only rescales the entry metrics.
+    ENTRY_QSS = """
+        QLineEdit {{
+            background-color: {entry_bg};
+            color: {text_primary};
+            border: 2px solid {border};
+            border-radius: 8px;
+            font-weight: bold;
+        }}
+        QLineEdit:focus {{
+            border-color: {accent_blue};
+        }}
+    """
+    ENTRY_ZOOM_QSS = """
+        QLineEdit {{
+            padding: {padding}px;
+            font-size: {font_size}px;
+            min-width: {min_width}px;
+            max-width: {max_width}px;
+        }}
+    """
+    
     def __init__(self):
         """Initialize the GUI application."""
         super().__init__()
@@ -35,16 +172,157 @@ class MatrixDeterminantGUI(QMainWindow):
             'success_green': '#00ff41'     # Success green
         }
         
+        # Stylesheets depend only on the theme colours, so format them once
+        self._qss = {
+            'title': f"""
+                QLabel {{
+                    color: {self.colors['text_primary']};
+                    font-size: 28px;
+                    font-weight: bold;
+                    margin-bottom: 10px;
+                }}
+            """,
+            'instructions': f"""
+                QLabel {{
+                    color: {self.colors['text_secondary']};
+                    font-size: 12px;
+                    font-style: italic;
+                    margin-bottom: 10px;
+                }}
+            """,
+            'size_label': f"""
+                QLabel {{
+                    color: {self.colors['text_primary']};
+                    font-size: 16px;
+                    font-weight: bold;
+                }}
+            """,
+            'spinbox': f"""
+                QSpinBox {{
+                    background-color: {self.colors['entry_bg']};
+                    color: {self.colors['text_primary']};
+                    border: 2px solid {self.colors['accent_blue']};
+                    border-radius: 8px;
+                    padding: 8px 12px;
+                    font-size: 14px;
+                    min-width: 80px;
+                }}
+                QSpinBox::up-button {{
+                    background-color: {self.colors['accent_blue']};
+                    border: none;
+                    border-radius: 3px;
+                    width: 20px;
+                }}
+                QSpinBox::up-button:hover {{
+                    background-color: {self.colors['accent_blue_light']};
+                }}
+                QSpinBox::down-button {{
+                    background-color: {self.colors['accent_blue']};
+                    border: none;
+                    border-radius: 3px;
+                    width: 20px;
+                }}
+                QSpinBox::down-button:hover {{
+                    background-color: {self.colors['accent_blue_light']};
+                }}
+            """,
+            'zoom_label': f"""
+                QLabel {{
+                    color: {self.colors['text_secondary']};
+                    font-size: 12px;
+                    font-weight: bold;
+                }}
+            """,
+            'checkbox': f"""
+                QCheckBox {{
+                    color: {self.colors['text_secondary']};
+                    font-size: 12px;
+                    font-weight: bold;
+                }}
+            """,
+            'scroll': f"""
+                QScrollArea {{
+                    background-color: {self.colors['bg_primary']};
+                    border: none;
+                }}
+            """,
+            'container': f"""
+                QWidget {{
+                    background-color: {self.colors['bg_primary']};
+                }}
+            """,
+            'matrix': f"""
+                QWidget {{
+                    background-color: {self.colors['bg_primary']};
+                }}
+            """ + self.ENTRY_QSS.format(**self.colors),
+            'table': f"""
+                QTableView {{
+                    background-color: {self.colors['entry_bg']};
+                    color: {self.colors['text_primary']};
+                    gridline-color: {self.colors['border']};
+                    border: 2px solid {self.colors['border']};
+                    border-radius: 8px;
+                    font-weight: bold;
+                }}
+                QTableView QLineEdit {{
+                    background-color: {self.colors['entry_bg']};
+                    color: {self.colors['text_primary']};
+                    border: 2px solid {self.colors['accent_blue']};
+                }}
+                QHeaderView::section {{
+                    background-color: {self.colors['bg_secondary']};
+                    color: {self.colors['text_secondary']};
+                    border: none;
+                    padding: 4px;
+                }}
+            """,
+            'button': f"""
+                QPushButton {{
+                    background-color: {self.colors['accent_blue']};
+                    color: {self.colors['text_primary']};
+                    border: none;
+                    border-radius: 12px;
+                    padding: 15px 30px;
+                    font-size: 16px;
+                    font-weight: bold;
+                    min-width: 200px;
+                }}
+                QPushButton:hover {{
+                    background-color: {self.colors['accent_blue_light']};
+                }}
+                QPushButton:pressed {{
+                    background-color: {self.colors['accent_blue_light']};
+                }}
+            """,
+            'result': f"""
+                QLabel {{
+                    color: {self.colors['success_green']};
+                    font-size: 24px;
+                    font-weight: bold;
+                    background-color: {self.colors['bg_secondary']};
+                    border: 2px solid {self.colors['accent_blue']};
+                    border-radius: 12px;
+                    padding: 20px;
+                    margin: 20px;
+                }}
+            """,
+        }
+        
         # Use case
         self.calculate_use_case = CalculateDeterminantUseCase()
         
         # GUI components
         self.matrix_entries: List[List[QLineEdit]] = []
+        self._entry_pool: List[QLineEdit] = []
         self.matrix_size_spinbox: Optional[QSpinBox] = None
         self.calculate_button: Optional[QPushButton] = None
         self.result_label: Optional[QLabel] = None
         self.matrix_widget: Optional[QWidget] = None
+        self.matrix_table: Optional[QTableView] = None
+        self.matrix_model: Optional[MatrixModel] = None
         self.matrix_scroll: Optional[QScrollArea] = None
+        self.show_steps_checkbox: Optional[QCheckBox] = None
         
         # Zoom variables
         self.zoom_factor = 1.0
@@ -52,22 +330,18 @@ class MatrixDeterminantGUI(QMainWindow):
         self.max_zoom = 3.0
         self.zoom_step = 0.1
         
-        self._setup_logging()
+        # One validator shared by every matrix entry and table editor
+        self._validator = QDoubleValidator(-1e18, 1e18, 10, self)
+        self._validator.setNotation(QDoubleValidator.StandardNotation)
+        # The C locale would otherwise accept "1,000", which float() cannot parse
+        locale = QLocale.c()
+        locale.setNumberOptions(QLocale.RejectGroupSeparator)
+        self._validator.setLocale(locale)
+        
         self._setup_ui()
         
         logger.info("Matrix Determinant GUI initialized with PyQt5 dark theme")
     
-    def _setup_logging(self):
-        """Setup logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('determinant_calculator.log'),
-                logging.StreamHandler()
-            ]
-        )
-    
     def _setup_ui(self):
         """Setup the user interface."""
         self.setWindowTitle("Calculadora de Determinante - Escalonamento")
@@ -88,27 +362,13 @@ class MatrixDeterminantGUI(QMainWindow):
         # Title
         title_label = QLabel("Calculadora de Determinante")
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_primary']};
-                font-size: 28px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }}
-        """)
+        title_label.setStyleSheet(self._qss['title'])
         main_layout.addWidget(title_label)
         
         # Instructions
         instructions_label = QLabel("💡 Dica: Use Ctrl + Scroll para fazer zoom na matriz")
         instructions_label.setAlignment(Qt.AlignCenter)
-        instructions_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_secondary']};
-                font-size: 12px;
-                font-style: italic;
-                margin-bottom: 10px;
-            }}
-        """)
+        instructions_label.setStyleSheet(self._qss['instructions'])
         main_layout.addWidget(instructions_label)
         
         
@@ -118,99 +378,76 @@ class MatrixDeterminantGUI(QMainWindow):
         
         # Matrix size selection
         size_label = QLabel("Ordem da Matriz:")
-        size_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_primary']};
-                font-size: 16px;
-                font-weight: bold;
-            }}
-        """)
+        size_label.setStyleSheet(self._qss['size_label'])
         top_layout.addWidget(size_label)
         
         self.matrix_size_spinbox = QSpinBox()
         self.matrix_size_spinbox.setMinimum(2)
         self.matrix_size_spinbox.setMaximum(50)  # Allow up to 50x50 matrix
         self.matrix_size_spinbox.setValue(3)
-        self.matrix_size_spinbox.setStyleSheet(f"""
-            QSpinBox {{
-                background-color: {self.colors['entry_bg']};
-                color: {self.colors['text_primary']};
-                border: 2px solid {self.colors['accent_blue']};
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 14px;
-                min-width: 80px;
-            }}
-            QSpinBox::up-button {{
-                background-color: {self.colors['accent_blue']};
-                border: none;
-                border-radius: 3px;
-                width: 20px;
-            }}
-            QSpinBox::up-button:hover {{
-                background-color: {self.colors['accent_blue_light']};
-            }}
-            QSpinBox::down-button {{
-                background-color: {self.colors['accent_blue']};
-                border: none;
-                border-radius: 3px;
-                width: 20px;
-            }}
-            QSpinBox::down-button:hover {{
-                background-color: {self.colors['accent_blue_light']};
-            }}
-        """)
+        self.matrix_size_spinbox.setStyleSheet(self._qss['spinbox'])
+        # Only react to committed values, then coalesce bursts of changes
+        self.matrix_size_spinbox.setKeyboardTracking(False)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(150)
+        self._resize_timer.timeout.connect(self._create_matrix_entries)
         self.matrix_size_spinbox.valueChanged.connect(self._on_size_changed)
         top_layout.addWidget(self.matrix_size_spinbox)
         
         # Zoom indicator
         self.zoom_label = QLabel("Zoom: 100%")
-        self.zoom_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['text_secondary']};
-                font-size: 12px;
-                font-weight: bold;
-            }}
-        """)
+        self.zoom_label.setStyleSheet(self._qss['zoom_label'])
         top_layout.addWidget(self.zoom_label)
         
+        # Step-by-step trace toggle (off: fast LAPACK path only)
+        self.show_steps_checkbox = QCheckBox("Mostrar passos")
+        self.show_steps_checkbox.setStyleSheet(self._qss['checkbox'])
+        top_layout.addWidget(self.show_steps_checkbox)
+        
         top_layout.addStretch()
         main_layout.addLayout(top_layout)
         
         # Matrix area with scroll and zoom
         self.matrix_scroll = QScrollArea()
         self.matrix_scroll.setWidgetResizable(True)
-        self.matrix_scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {self.colors['bg_primary']};
-                border: none;
-            }}
-        """)
-        # Enable wheel events for zoom
-        self.matrix_scroll.wheelEvent = self._on_wheel_event
+        self.matrix_scroll.setStyleSheet(self._qss['scroll'])
+        # Ctrl+wheel over the matrix zooms; plain wheel scrolls natively
+        self.matrix_scroll.viewport().installEventFilter(self)
+        # Restyle at most once per frame (~60Hz) however fast the wheel spins
+        self._zoom_dirty_timer = QTimer(self)
+        self._zoom_dirty_timer.setSingleShot(True)
+        self._zoom_dirty_timer.setInterval(16)
+        self._zoom_dirty_timer.timeout.connect(self._apply_zoom)
         
         # Create matrix container widget
         self.matrix_container = QWidget()
-        self.matrix_container.setStyleSheet(f"""
-            QWidget {{
-                background-color: {self.colors['bg_primary']};
-            }}
-        """)
+        self.matrix_container.setStyleSheet(self._qss['container'])
         self.matrix_scroll.setWidget(self.matrix_container)
         
         # Create matrix layout
         self.matrix_layout = QVBoxLayout(self.matrix_container)
         self.matrix_layout.setAlignment(Qt.AlignCenter)
         
-        # Create matrix grid widget
+        # Create matrix grid widget; it carries the stylesheet for all entries
         self.matrix_widget = QWidget()
-        self.matrix_widget.setStyleSheet(f"""
-            QWidget {{
-                background-color: {self.colors['bg_primary']};
-            }}
-        """)
+        self.matrix_widget.setStyleSheet(self._matrix_stylesheet())
+        self.matrix_grid = QGridLayout(self.matrix_widget)
+        self.matrix_grid.setSpacing(10)
+        self.matrix_grid.setContentsMargins(20, 20, 20, 20)
+        self.matrix_grid.setAlignment(Qt.AlignCenter)
         self.matrix_layout.addWidget(self.matrix_widget)
         
+        # Table used instead of the grid for large matrices
+        self.matrix_model = MatrixModel(self)
+        self.matrix_table = QTableView()
+        self.matrix_table.setModel(self.matrix_model)
+        self.matrix_table.setItemDelegate(NumericDelegate(self._validator, self.matrix_table))
+        self.matrix_table.setStyleSheet(self._qss['table'])
+        self.matrix_table.viewport().installEventFilter(self)
+        self.matrix_table.hide()
+        self.matrix_layout.addWidget(self.matrix_table)
+        
         main_layout.addWidget(self.matrix_scroll, 1)
         
         # Bottom area with button
@@ -218,24 +455,7 @@ class MatrixDeterminantGUI(QMainWindow):
         bottom_layout.addStretch()
         
         self.calculate_button = QPushButton("Achar Determinante")
-        self.calculate_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.colors['accent_blue']};
-                color: {self.colors['text_primary']};
-                border: none;
-                border-radius: 12px;
-                padding: 15px 30px;
-                font-size: 16px;
-                font-weight: bold;
-                min-width: 200px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.colors['accent_blue_light']};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.colors['accent_blue_light']};
-            }}
-        """)
+        self.calculate_button.setStyleSheet(self._qss['button'])
         self.calculate_button.clicked.connect(self._calculate_determinant)
         bottom_layout.addWidget(self.calculate_button)
         
@@ -245,18 +465,7 @@ class MatrixDeterminantGUI(QMainWindow):
         # Result label (initially hidden)
         self.result_label = QLabel("")
         self.result_label.setAlignment(Qt.AlignCenter)
-        self.result_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.colors['success_green']};
-                font-size: 24px;
-                font-weight: bold;
-                background-color: {self.colors['bg_secondary']};
-                border: 2px solid {self.colors['accent_blue']};
-                border-radius: 12px;
-                padding: 20px;
-                margin: 20px;
-            }}
-        """)
+        self.result_label.setStyleSheet(self._qss['result'])
         self.result_label.hide()
         main_layout.addWidget(self.result_label)
         
@@ -285,82 +494,62 @@ class MatrixDeterminantGUI(QMainWindow):
     def _on_size_changed(self):
         """Handle matrix size change."""
         size = self.matrix_size_spinbox.value()
-        logger.info(f"Matrix size changed to: {size}")
-        self._create_matrix_entries()
+        logger.debug("Matrix size changed to: %d", size)
+        self._resize_timer.start()
     
     def _create_matrix_entries(self):
-        """Create matrix input entries based on selected size with dark theme."""
-        # Clear existing entries
-        for widget in self.matrix_widget.findChildren(QLineEdit):
-            widget.deleteLater()
-        self.matrix_entries.clear()
-        
-        # Remove matrix widget from layout
-        self.matrix_layout.removeWidget(self.matrix_widget)
-        self.matrix_widget.deleteLater()
-        
-        # Create new matrix widget
-        self.matrix_widget = QWidget()
-        self.matrix_widget.setStyleSheet(f"""
-            QWidget {{
-                background-color: {self.colors['bg_primary']};
-            }}
-        """)
-        
+        """Lay out matrix input entries for the selected size, reusing pooled entries."""
         try:
             size = self.matrix_size_spinbox.value()
             if size < 2 or size > 50:
                 QMessageBox.warning(self, "Erro", "Tamanho da matriz deve estar entre 2 e 50")
                 return
             
-            logger.info(f"Creating matrix entries for {size}x{size} matrix")
-            
-            # Create grid layout for matrix
-            matrix_grid = QGridLayout()
-            matrix_grid.setSpacing(10)
-            matrix_grid.setContentsMargins(20, 20, 20, 20)
-            
-            # Create entries with dark theme
-            for i in range(size):
-                row_entries = []
-                for j in range(size):
-                    entry = QLineEdit()
-                    entry.setAlignment(Qt.AlignCenter)
-                    entry.setText("0")
-                    entry.setMaxLength(10)
-                    entry.setStyleSheet(f"""
-                        QLineEdit {{
-                            background-color: {self.colors['entry_bg']};
-                            color: {self.colors['text_primary']};
-                            border: 2px solid {self.colors['border']};
-                            border-radius: 8px;
-                            padding: 8px;
-                            font-size: 14px;
-                            font-weight: bold;
-                            min-width: 60px;
-                            max-width: 80px;
-                        }}
-                        QLineEdit:focus {{
-                            border-color: {self.colors['accent_blue']};
-                        }}
-                    """)
-                    
-                    # Connect signals for better UX
-                    entry.returnPressed.connect(self._focus_next_entry)
-                    entry.textChanged.connect(lambda: self._on_entry_changed())
-                    
-                    matrix_grid.addWidget(entry, i, j)
-                    row_entries.append(entry)
-                self.matrix_entries.append(row_entries)
+            logger.debug("Creating matrix entries for %dx%d matrix", size, size)
             
-            # Center the matrix
-            matrix_grid.setAlignment(Qt.AlignCenter)
-            
-            # Set the layout to the widget
-            self.matrix_widget.setLayout(matrix_grid)
+            if size >= LARGE_MATRIX_THRESHOLD:
+                self._show_matrix_table(size)
+                return
             
-            # Add matrix widget back to layout
-            self.matrix_layout.addWidget(self.matrix_widget)
+            # Freeze painting while the grid is rebuilt, then repaint once
+            self.matrix_container.setUpdatesEnabled(False)
+            self.matrix_scroll.setUpdatesEnabled(False)
+            try:
+                self.matrix_table.hide()
+                self.matrix_widget.show()
+                
+                # Take every pooled entry out of the grid before re-placing them
+                for entry in self._entry_pool:
+                    self.matrix_grid.removeWidget(entry)
+                
+                # Only create the entries the pool is missing
+                needed = size * size
+                for _ in range(needed - len(self._entry_pool)):
+                    self._entry_pool.append(self._new_matrix_entry())
+                
+                self.matrix_entries = []
+                for i in range(size):
+                    row_entries = self._entry_pool[i * size:(i + 1) * size]
+                    for j, entry in enumerate(row_entries):
+                        entry.blockSignals(True)
+                        entry.setText("0")
+                        entry.blockSignals(False)
+                        self.matrix_grid.addWidget(entry, i, j)
+                        entry.show()
+                    self.matrix_entries.append(row_entries)
+                
+                # Surplus entries stay pooled for a later, larger matrix
+                for entry in self._entry_pool[needed:]:
+                    entry.hide()
+                
+                # Tab order: left to right, top to bottom, then the calculate button
+                flat = self._entry_pool[:needed]
+                for current, following in zip(flat, flat[1:]):
+                    QWidget.setTabOrder(current, following)
+                QWidget.setTabOrder(flat[-1], self.calculate_button)
+            finally:
+                self.matrix_container.setUpdatesEnabled(True)
+                self.matrix_scroll.setUpdatesEnabled(True)
             
             # Force update
             self.matrix_widget.update()
@@ -369,28 +558,57 @@ class MatrixDeterminantGUI(QMainWindow):
         except ValueError:
             QMessageBox.warning(self, "Erro", "Tamanho da matriz deve ser um número válido")
     
-    def _on_entry_changed(self):
-        """Handle entry text change."""
-        pass
+    def _show_matrix_table(self, size: int):
+        """Switch to the table view for a large size x size matrix."""
+        self.matrix_widget.hide()
+        self.matrix_entries = []
+        self.matrix_model.reset(size)
+        self._apply_table_zoom()
+        self.matrix_table.show()
+        QWidget.setTabOrder(self.matrix_table, self.calculate_button)
+    
+    def _apply_table_zoom(self):
+        """Scale the table's font and cell size with the zoom factor."""
+        font = self.matrix_table.font()
+        font.setPixelSize(int(14 * self.zoom_factor))
+        self.matrix_table.setFont(font)
+        self.matrix_table.horizontalHeader().setDefaultSectionSize(int(70 * self.zoom_factor))
+        self.matrix_table.verticalHeader().setDefaultSectionSize(int(36 * self.zoom_factor))
+    
+    def _new_matrix_entry(self) -> QLineEdit:
+        """Create a matrix input entry for the entry pool."""
+        entry = QLineEdit(self.matrix_widget)
+        entry.setAlignment(Qt.AlignCenter)
+        entry.setMaxLength(10)
+        entry.setValidator(self._validator)
+        
+        # Enter moves along the same focus chain as Tab
+        entry.returnPressed.connect(self.focusNextChild)
+        
+        return entry
+    
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Intercept Ctrl+wheel on the matrix viewports for zooming."""
+        if (event.type() == QEvent.Wheel
+                and event.modifiers() & Qt.ControlModifier
+                and obj in (self.matrix_scroll.viewport(), self.matrix_table.viewport())):
+            self._on_wheel_event(event)
+            return True
+        return super().eventFilter(obj, event)
     
     def _on_wheel_event(self, event: QWheelEvent):
         """Handle wheel event for zooming."""
-        # Check if Ctrl key is pressed for zoom
-        if event.modifiers() & Qt.ControlModifier:
-            # Get wheel delta
-            delta = event.angleDelta().y()
-            
-            if delta > 0:  # Zoom in
-                self.zoom_factor = min(self.zoom_factor + self.zoom_step, self.max_zoom)
-            else:  # Zoom out
-                self.zoom_factor = max(self.zoom_factor - self.zoom_step, self.min_zoom)
-            
-            # Apply zoom
-            self._apply_zoom()
-            event.accept()
-        else:
-            # Normal scroll behavior
-            QScrollArea.wheelEvent(self.matrix_scroll, event)
+        # Get wheel delta
+        delta = event.angleDelta().y()
+        
+        if delta > 0:  # Zoom in
+            self.zoom_factor = min(self.zoom_factor + self.zoom_step, self.max_zoom)
+        else:  # Zoom out
+            self.zoom_factor = max(self.zoom_factor - self.zoom_step, self.min_zoom)
+        
+        # Apply zoom on the next frame unless already pending
+        if not self._zoom_dirty_timer.isActive():
+            self._zoom_dirty_timer.start()
     
     def _apply_zoom(self):
         """Apply zoom to the matrix widget."""
@@ -399,86 +617,41 @@ class MatrixDeterminantGUI(QMainWindow):
             zoom_percentage = int(self.zoom_factor * 100)
             self.zoom_label.setText(f"Zoom: {zoom_percentage}%")
             
-            # Apply zoom by scaling font sizes and spacing
-            font_size = int(14 * self.zoom_factor)
-            padding = int(8 * self.zoom_factor)
-            min_width = int(60 * self.zoom_factor)
-            max_width = int(80 * self.zoom_factor)
-            
-            # Update matrix widget style
-            self.matrix_widget.setStyleSheet(f"""
-                QWidget {{
-                    background-color: {self.colors['bg_primary']};
-                    transform: scale({self.zoom_factor});
-                }}
-            """)
-            
-            # Update entry styles
-            for row_entries in self.matrix_entries:
-                for entry in row_entries:
-                    entry.setStyleSheet(f"""
-                        QLineEdit {{
-                            background-color: {self.colors['entry_bg']};
-                            color: {self.colors['text_primary']};
-                            border: 2px solid {self.colors['border']};
-                            border-radius: 8px;
-                            padding: {padding}px;
-                            font-size: {font_size}px;
-                            font-weight: bold;
-                            min-width: {min_width}px;
-                            max-width: {max_width}px;
-                        }}
-                        QLineEdit:focus {{
-                            border-color: {self.colors['accent_blue']};
-                        }}
-                    """)
+            # One stylesheet on the container restyles every entry at once
+            self.matrix_widget.setStyleSheet(self._matrix_stylesheet())
+            self._apply_table_zoom()
             
             # Update scroll area
             self.matrix_scroll.update()
             
             logger.debug(f"Zoom applied: {self.zoom_factor:.2f}x")
     
-    def wheelEvent(self, event: QWheelEvent):
-        """Override wheel event for the main window."""
-        # Check if mouse is over matrix area
-        if self.matrix_scroll.underMouse():
-            self._on_wheel_event(event)
-        else:
-            super().wheelEvent(event)
-    
-    def _focus_next_entry(self):
-        """Focus next entry in tab order."""
-        # Simple tab order: left to right, top to bottom
-        current_widget = self.focusWidget()
-        
-        for i, row_entries in enumerate(self.matrix_entries):
-            for j, entry in enumerate(row_entries):
-                if entry == current_widget:
-                    # Find next entry
-                    if j < len(row_entries) - 1:
-                        row_entries[j + 1].setFocus()
-                    elif i < len(self.matrix_entries) - 1:
-                        self.matrix_entries[i + 1][0].setFocus()
-                    else:
-                        # Last entry, focus calculate button
-                        self.calculate_button.setFocus()
-                    return
-    
-    def _get_matrix_data(self) -> List[List[float]]:
+    def _matrix_stylesheet(self) -> str:
+        """Build the matrix container stylesheet for the current zoom factor."""
+        return self._qss['matrix'] + self.ENTRY_ZOOM_QSS.format(
+            padding=int(8 * self.zoom_factor),
+            font_size=int(14 * self.zoom_factor),
+            min_width=int(60 * self.zoom_factor),
+            max_width=int(80 * self.zoom_factor)
+        )
+    
+    def _get_matrix_data(self) -> np.ndarray:
         """Extract matrix data from input entries."""
-        matrix_data = []
+        # The table model already holds parsed values
+        if not self.matrix_table.isHidden():
+            return self.matrix_model.arr.copy()
+        
+        size = len(self.matrix_entries)
+        entries = [entry for row_entries in self.matrix_entries for entry in row_entries]
         
-        for row_entries in self.matrix_entries:
-            row_data = []
-            for entry in row_entries:
-                try:
-                    value = float(entry.text())
-                    row_data.append(value)
-                except ValueError:
-                    raise ValueError("Todos os elementos devem ser números válidos")
-            matrix_data.append(row_data)
+        # The validator only lets through numbers or unfinished input like "-"
+        if not all(entry.hasAcceptableInput() or not entry.text() for entry in entries):
+            raise ValueError("Todos os elementos devem ser números válidos")
         
-        return matrix_data
+        # Empty entries count as zero
+        values = np.fromiter((float(entry.text() or "0") for entry in entries),
+                             dtype=np.float64, count=len(entries))
+        return values.reshape(size, size)
     
     def _calculate_determinant(self):
         """Calculate matrix determinant and display result."""
@@ -497,13 +670,13 @@ class MatrixDeterminantGUI(QMainWindow):
                 QMessageBox.warning(self, "Erro de Validação", error_msg)
                 return
             
-            # Calculate determinant
-            determinant, steps = self.calculate_use_case.execute(matrix_data)
-            
-            # Show result
-            self._show_result(determinant)
-            
-            logger.info(f"Determinant calculation completed: {determinant}")
+            # Calculate determinant off the GUI thread
+            self.calculate_button.setEnabled(False)
+            task = DeterminantTask(self.calculate_use_case, matrix_data,
+                                   self.show_steps_checkbox.isChecked())
+            task.signals.finished.connect(self._on_calculation_finished)
+            task.signals.error.connect(self._on_calculation_error)
+            QThreadPool.globalInstance().start(task)
             
         except ValueError as e:
             error_msg = str(e)
@@ -515,6 +688,18 @@ class MatrixDeterminantGUI(QMainWindow):
             QMessageBox.warning(self, "Erro", error_msg)
             logger.error(f"Unexpected error in calculation: {str(e)}")
     
+    def _on_calculation_finished(self, determinant: float):
+        """Show the result delivered by the background calculation."""
+        self.calculate_button.setEnabled(True)
+        self._show_result(determinant)
+        logger.info(f"Determinant calculation completed: {determinant}")
+    
+    def _on_calculation_error(self, error_msg: str):
+        """Report an error raised by the background calculation."""
+        self.calculate_button.setEnabled(True)
+        QMessageBox.warning(self, "Erro", error_msg)
+        logger.error(f"Error in background calculation: {error_msg}")
+    
     def _show_result(self, determinant: float):
         """Show result with animation."""
         result_text = f"Determinante = {determinant:.6f}"
@@ -531,6 +716,10 @@ class MatrixDeterminantGUI(QMainWindow):
 
 def main():
     """Main function to run the application."""
+    # main.setup_logging configures logging; only fall back when run standalone
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO)
+    
     app = QApplication(sys.argv)
     
     # Set application properties
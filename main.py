@@ -2,9 +2,12 @@
 Main application entry point for Matrix Determinant Calculator.
 Uses Clean Architecture principles with separated layers and PyQt5.
 """
+import atexit
 import logging
+import queue
 import sys
 import os
+from logging.handlers import QueueHandler, QueueListener
 from PyQt5.QtWidgets import QApplication
 
 # Add project root to Python path
@@ -14,15 +17,27 @@ from interfaces.gui import main as gui_main
 
 
 def setup_logging():
-    """Setup application-wide logging configuration."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('determinant_calculator.log', encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    """
+    Setup application-wide logging configuration.
+    
+    Log calls only enqueue the record; a QueueListener thread writes it to
+    the log file and the console, keeping disk I/O off the GUI thread.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('determinant_calculator.log', encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Only the message is merged here; the listener's handlers add the prefix
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
     
     # Set specific log levels for different modules
     logging.getLogger('entities').setLevel(logging.DEBUG)
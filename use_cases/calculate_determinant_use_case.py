@@ -2,12 +2,16 @@
 Use case for calculating matrix determinant.
 """
 import logging
-from typing import List, Tuple
+from typing import List, Tuple, Union
+import numpy as np
 from entities.matrix import Matrix
 from entities.determinant_calculator import DeterminantCalculator
 
 logger = logging.getLogger(__name__)
 
+# Largest log|det| whose exponential is still a finite float
+_LOG_FLOAT_MAX = float(np.log(np.finfo(np.float64).max))
+
 
 class CalculateDeterminantUseCase:
     """Use case for calculating matrix determinant with logging."""
@@ -17,12 +21,12 @@ class CalculateDeterminantUseCase:
         self.calculator = DeterminantCalculator()
         logger.info("CalculateDeterminantUseCase initialized")
     
-    def execute(self, matrix_data: List[List[float]]) -> Tuple[float, List[str]]:
+    def execute(self, matrix_data: Union[List[List[float]], np.ndarray]) -> Tuple[float, List[str]]:
         """
         Execute determinant calculation.
         
         Args:
-            matrix_data: 2D list representing matrix elements
+            matrix_data: 2D list or 2D ndarray representing matrix elements
             
         Returns:
             Tuple of (determinant_value, calculation_steps)
@@ -47,30 +51,70 @@ class CalculateDeterminantUseCase:
             logger.error(f"Error in determinant calculation: {str(e)}")
             raise
     
-    def validate_matrix_data(self, matrix_data: List[List[float]]) -> Tuple[bool, str]:
+    def execute_fast(self, matrix_data: Union[List[List[float]], np.ndarray]) -> float:
         """
-        Validate matrix data before calculation.
+        Execute determinant calculation without tracing steps.
         
         Args:
-            matrix_data: 2D list representing matrix elements
+            matrix_data: 2D list or 2D ndarray representing matrix elements
             
         Returns:
-            Tuple of (is_valid, error_message)
+            Determinant value
+            
+        Raises:
+            ValueError: If matrix is invalid or not square
         """
+        logger.info("Starting fast determinant calculation use case")
+        
         try:
-            if not matrix_data:
-                return False, "Matrix cannot be empty"
+            # Create matrix entity
+            matrix = Matrix(matrix_data, copy=False)
+            if not matrix.is_square:
+                raise ValueError("Matrix must be square to calculate determinant")
+            arr = matrix.to_array(copy=False)
+            
+            # A zero row or column makes the matrix singular
+            if not arr.any(axis=1).all() or not arr.any(axis=0).all():
+                logger.info("Matrix has a zero row or column, determinant is 0")
+                return 0.0
             
-            if not all(isinstance(row, list) for row in matrix_data):
-                return False, "All rows must be lists"
+            if matrix.rows <= 4:
+                determinant = self.calculator.calculate(matrix)
+            else:
+                # Sum logs of the LU pivots so partial products cannot overflow
+                sign, log_det = self.calculator.calculate_log(matrix)
+                if sign == 0.0:
+                    determinant = 0.0
+                elif log_det > _LOG_FLOAT_MAX:
+                    determinant = sign * float('inf')
+                else:
+                    determinant = sign * float(np.exp(log_det))
             
-            if not all(len(row) == len(matrix_data[0]) for row in matrix_data):
-                return False, "All rows must have the same length"
+            logger.info(f"Determinant calculation completed: {determinant}")
+            return determinant
             
-            if not all(isinstance(element, (int, float)) for row in matrix_data for element in row):
-                return False, "All elements must be numbers"
+        except Exception as e:
+            logger.error(f"Error in determinant calculation: {str(e)}")
+            raise
+    
+    def validate_matrix_data(self, matrix_data: Union[List[List[float]], np.ndarray]) -> Tuple[bool, str]:
+        """
+        Validate matrix data before calculation.
+        
+        Args:
+            matrix_data: 2D list or 2D ndarray representing matrix elements
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        try:
+            # The entity owns the shape and element type rules
+            try:
+                arr = Matrix.validate_data(matrix_data)
+            except ValueError as e:
+                return False, str(e)
             
-            if len(matrix_data) != len(matrix_data[0]):
+            if arr.shape[0] != arr.shape[1]:
                 return False, "Matrix must be square to calculate determinant"
             
             return True, ""